@@ -7,7 +7,6 @@ This connects as a separate follower to monitor the master's output.
 import sys
 import os
 import time
-import json
 import zmq
 from datetime import datetime
 
@@ -58,46 +57,42 @@ class SystemMonitor:
             while True:
                 # Check for messages with timeout
                 if self.master_sub.poll(timeout=100):
-                    message = self.master_sub.recv_string()
+                    # Topic and payload arrive as separate frames
+                    _topic, payload = self.master_sub.recv_multipart()
+                    joints, timestamp = deserialize_joint_message(payload)
                     
-                    # Parse message
-                    if message.startswith("follower_commands"):
-                        json_data = message[len("follower_commands"):].strip()
-                        data = json.loads(json_data)
-                        joints, timestamp = deserialize_joint_message(data)
-                        
-                        self.messages_received += 1
-                        rate_counter += 1
-                        
-                        # Calculate message age
-                        current_time = time.time()
-                        age_ms = (current_time - timestamp) * 1000 if timestamp else 0
-                        
-                        # Format joint values
-                        joint_str = "[" + ", ".join([f"{j:6.3f}" for j in joints]) + "]"
-                        
-                        # Calculate rate every second
-                        if current_time - last_rate_check >= 1.0:
-                            current_rate = rate_counter / (current_time - last_rate_check)
-                            rate_counter = 0
-                            last_rate_check = current_time
-                        
-                        # Print status line
-                        time_str = datetime.now().strftime('%H:%M:%S.%f')[:-3]
-                        print(f"{time_str} {age_ms:6.1f}ms  {joint_str:<60} {current_rate:6.1f}Hz")
-                        
-                        # Store in history
-                        self.joint_history.append({
-                            'timestamp': timestamp,
-                            'joints': joints,
-                            'age_ms': age_ms
-                        })
-                        
-                        # Limit history size
-                        if len(self.joint_history) > self.max_history:
-                            self.joint_history.pop(0)
-                        
-                        self.last_timestamp = timestamp
+                    self.messages_received += 1
+                    rate_counter += 1
+                    
+                    # Calculate message age
+                    current_time = time.time()
+                    age_ms = (current_time - timestamp) * 1000 if timestamp else 0
+                    
+                    # Format joint values
+                    joint_str = "[" + ", ".join([f"{j:6.3f}" for j in joints]) + "]"
+                    
+                    # Calculate rate every second
+                    if current_time - last_rate_check >= 1.0:
+                        current_rate = rate_counter / (current_time - last_rate_check)
+                        rate_counter = 0
+                        last_rate_check = current_time
+                    
+                    # Print status line
+                    time_str = datetime.now().strftime('%H:%M:%S.%f')[:-3]
+                    print(f"{time_str} {age_ms:6.1f}ms  {joint_str:<60} {current_rate:6.1f}Hz")
+                    
+                    # Store in history
+                    self.joint_history.append({
+                        'timestamp': timestamp,
+                        'joints': joints,
+                        'age_ms': age_ms
+                    })
+                    
+                    # Limit history size
+                    if len(self.joint_history) > self.max_history:
+                        self.joint_history.pop(0)
+                    
+                    self.last_timestamp = timestamp
                     
                 else:
                     # No message received in timeout
@@ -74,25 +74,22 @@ class FollowerNode:
             try:
                 # Use polling to allow clean shutdown
                 if self.subscriber.poll(timeout=100):  # 100ms timeout
-                    message = self.subscriber.recv_string()
+                    # Topic and payload arrive as separate frames; the SUB
+                    # filter has already matched the topic frame
+                    _topic, payload = self.subscriber.recv_multipart()
                     
-                    # Remove topic prefix
-                    if message.startswith(self.topic):
-                        json_data = message[len(self.topic):].strip()
-                        data = json.loads(json_data)
-                        
-                        joint_data, timestamp = deserialize_joint_message(data)
-                        
-                        # Convert to JointState if it's a list (backward compatibility)
-                        if isinstance(joint_data, list):
-                            joint_state = JointState.from_list(joint_data, timestamp=timestamp)
-                        else:
-                            joint_state = joint_data
-                        
-                        with self.lock:
-                            self.latest_joint_state = joint_state
-                        
-                        logger.debug(f"Received joint state: {joint_state}")
+                    joint_data, timestamp = deserialize_joint_message(payload)
+                    
+                    # Convert to JointState if it's a list (backward compatibility)
+                    if isinstance(joint_data, list):
+                        joint_state = JointState.from_list(joint_data, timestamp=timestamp)
+                    else:
+                        joint_state = joint_data
+                    
+                    with self.lock:
+                        self.latest_joint_state = joint_state
+                    
+                    logger.debug(f"Received joint state: {joint_state}")
                         
             except zmq.ZMQError as e:
                 if self.running:
@@ -9,7 +9,8 @@ from .utils import (
     serialize_joint_message,
     validate_joint_limits,
     transform_joints,
-    load_config
+    load_config,
+    json_dumps
 )
 from .joint_state import JointState
 
@@ -51,6 +52,7 @@ class MasterNode:
         self.publish_address = publish_address
         self.subscribe_topic = subscribe_topic
         self.publish_topic = publish_topic
+        self._publish_topic_bytes = publish_topic.encode()
         
         # Load configuration
         if config_path:
@@ -173,10 +175,11 @@ class MasterNode:
                             processed_state = self.process_joint_state(joint_state)
                             
                             if processed_state is not None:
-                                # Publish to follower
+                                # Publish to follower as [topic, payload] frames
                                 follower_message = serialize_joint_message(processed_state)
-                                topic_message = f"{self.publish_topic} {json.dumps(follower_message)}"
-                                self.publisher.send_string(topic_message)
+                                self.publisher.send_multipart(
+                                    [self._publish_topic_bytes, json_dumps(follower_message)]
+                                )
                                 
                                 self.messages_published += 1
                                 logger.debug(f"Published joint state to follower: {processed_state}")
@@ -4,6 +4,23 @@ import logging
 from typing import Dict, List, Tuple, Optional, Any, Union
 from .joint_state import JointState
 
+try:
+    import orjson
+
+    def json_dumps(message: Dict) -> bytes:
+        """Encode a message dictionary as UTF-8 JSON bytes."""
+        return orjson.dumps(message, option=orjson.OPT_SERIALIZE_NUMPY)
+
+    json_loads = orjson.loads
+except ImportError:
+    import json
+
+    def json_dumps(message: Dict) -> bytes:
+        """Encode a message dictionary as UTF-8 JSON bytes."""
+        return json.dumps(message).encode()
+
+    json_loads = json.loads
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -168,16 +185,19 @@ def serialize_joint_message(joint_state: Union[JointState, List[float]], timesta
         return js.to_dict()
 
 
-def deserialize_joint_message(message: Dict) -> Tuple[Union[JointState, List[float]], float]:
+def deserialize_joint_message(message: Union[Dict, bytes]) -> Tuple[Union[JointState, List[float]], float]:
     """
     Deserialize a joint message dictionary.
     
     Args:
-        message: Dictionary containing joint state and metadata
+        message: Dictionary containing joint state and metadata, or its raw JSON bytes
         
     Returns:
         Tuple of (JointState or joint_values, timestamp) depending on message format
     """
+    if isinstance(message, (bytes, bytearray)):
+        message = json_loads(message)
+    
     # Check if this is a new format with individual joint fields
     if 'joint_0' in message:
         # New format: return JointState
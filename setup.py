@@ -30,6 +30,9 @@ setup(
         "pyyaml>=5.4.0",
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.6.0",
+        ],
         "dev": [
             "pytest>=6.0",
             "black>=21.0",
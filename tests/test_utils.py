@@ -196,6 +196,18 @@ class TestMessageSerialization:
         assert joint_data == [0.1, 0.2, 0.3, 0.4, 0.5, 0.6]
         assert timestamp == 12345.0
 
+    def test_deserialize_json_bytes(self):
+        """Test deserializing a raw JSON payload straight off the wire."""
+        payload = b'{"joint_0": 0.1, "joint_1": 0.2, "joint_2": 0.3, "joint_3": 0.4, ' \
+                  b'"joint_4": 0.5, "joint_5": 0.6, "gripper": 0.8, "timestamp": 12345.0}'
+        
+        joint_data, timestamp = deserialize_joint_message(payload)
+        
+        assert isinstance(joint_data, JointState)
+        assert joint_data.joint_5 == 0.6
+        assert joint_data.gripper == 0.8
+        assert timestamp == 12345.0
+
     def test_roundtrip_serialization(self):
         """Test that serialization is lossless."""
         original = JointState(